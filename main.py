@@ -1,16 +1,98 @@
 import argparse
+import collections
+import contextlib
+import glob
+import hashlib
+import importlib.util
 import json
-import xml.etree.ElementTree as ET
-import yaml
 import logging
+import math
+import mmap
 import os
-import jsonschema
-from jsonschema import validate
-from pathlib import Path
+import re
+import stat
+import sys
+from typing import Any, Callable, Optional, Union
+from urllib.parse import urljoin
+
+try:
+    import orjson  # C-accelerated JSON parser, used when available
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# yaml, jsonschema, fastjsonschema and lxml are imported on first use by the code path
+# for the requested file type, so validating one format does not pay for the others.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Integer literals this long may not fit in 64 bits, which orjson would silently parse as floats
+_WIDE_INTEGER = re.compile(rb'\d{19,}')
+
+# Files at least this large are memory-mapped instead of read into a bytes object
+_MMAP_THRESHOLD = 1 << 20
+
+# Generated fastjsonschema functions; the first one defined validates the root schema
+_FJS_FUNCTION_DEF = re.compile(r'^def (\w+)\(', re.MULTILINE)
+
+# Directory holding generated fastjsonschema validator modules, reused across runs
+_CODE_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'file-validator')
+
+# Compiled jsonschema validators, keyed by a hash of the schema they were built from
+_VALIDATORS: dict[str, Any] = {}
+# Hashes of schemas already checked against their meta-schema
+_CHECKED_SCHEMAS: set[str] = set()
+# Code-generated fastjsonschema validators (None when the schema needs jsonschema), same keys
+_FJS_CACHE: dict[str, Optional[Callable[[Any], Any]]] = {}
+# (schema hash, document hash) pairs that recently passed validation, oldest first
+_VALIDATION_CACHE: collections.OrderedDict[tuple[str, str], bool] = collections.OrderedDict()
+_VALIDATION_CACHE_SIZE = 1024
+# Per-item validation plans for array-of-records schemas (None when not applicable), same keys
+_ARRAY_PLANS: dict[str, Optional[tuple[Callable[[Any], Any], Callable[[Any], Any]]]] = {}
+
+# msgspec decoders generated from JSON schemas for --fast mode (None when unsupported), same keys
+_MSGSPEC_DECODERS: dict[str, Any] = {}
+
+# JSON Schema primitive types and the Python types msgspec decodes them into
+_MSGSPEC_PRIMITIVES = {'string': str, 'integer': int, 'number': float, 'boolean': bool, 'null': type(None)}
+# Keywords that carry no constraints and can be ignored when generating msgspec types
+_MSGSPEC_ANNOTATIONS = {'$schema', 'title', 'description'}
+
+# Schema keywords whose values are instance data rather than subschemas
+_NON_SCHEMA_KEYWORDS = {'enum', 'const', 'default', 'examples'}
+
+# Drafts fastjsonschema validates the same way jsonschema does when a schema declares them
+_FAST_DRAFTS = ('draft-04', 'draft-06', 'draft-07')
+# Keywords that are new in draft 2019-09/2020-12, or whose meaning changed there; schemas
+# without a $schema that use any of them are left to jsonschema, which applies 2020-12
+_DRAFT_SENSITIVE_KEYWORDS = {
+    'prefixItems', 'unevaluatedProperties', 'unevaluatedItems', 'dependentRequired', 'dependentSchemas',
+    'minContains', 'maxContains', 'contentSchema', '$anchor', '$dynamicRef', '$dynamicAnchor',
+    '$recursiveRef', '$recursiveAnchor', '$vocabulary', 'dependencies', 'additionalItems',
+}
+# Keywords fastjsonschema treats differently from jsonschema under every draft: content
+# annotations it enforces, regexes it anchors differently and float multipleOf rounding
+_FAST_DIVERGENT_KEYWORDS = {'contentEncoding', 'contentMediaType', 'pattern', 'patternProperties', 'multipleOf'}
+
+# Array schema keywords that can be checked separately from the per-item validation
+_ARRAY_SCHEMA_KEYWORDS = {'$schema', 'title', 'description', 'type', 'items', 'minItems', 'maxItems', 'uniqueItems'}
+
+# Compiled lxml XMLSchema objects, keyed by (xsd path, modification time)
+_XSD_CACHE: dict[tuple[str, float], Any] = {}
+
+# lxml parse options for data files: only internal entities expanded, no oversized trees, no blank text nodes
+_XML_PARSE_OPTIONS = {'resolve_entities': 'internal', 'huge_tree': False, 'remove_blank_text': True}
+# Whitespace, processing instructions and comments that may precede a DOCTYPE in an XML prolog
+_XML_PROLOG_MISC = re.compile(rb'(?:\s+|<\?.*?\?>|<!--.*?-->)*', re.DOTALL)
+# Shared lxml parser for data files, created on first use
+_XML_PARSER: Optional[Any] = None
+
+# File extensions picked up when a directory is given as the data path
+_FILE_EXTENSIONS = {'json': ('.json',), 'yaml': ('.yaml', '.yml'), 'xml': ('.xml',)}
+
+# Schema and options used by batch validation worker processes, set by _init_batch_worker
+_BATCH_CONFIG: dict[str, Any] = {}
+
 
 def setup_argparse():
     """
@@ -20,59 +102,218 @@ def setup_argparse():
         argparse.ArgumentParser: The argument parser object.
     """
     parser = argparse.ArgumentParser(description="Validates structured data files against a schema.")
-    parser.add_argument("file_path", help="Path to the data file.")
+    parser.add_argument("file_path", help="Path to the data file, or a directory or glob pattern to validate many files.")
     parser.add_argument("schema_path", help="Path to the schema file.")
     parser.add_argument("--file_type", choices=['json', 'xml', 'yaml'], required=True, help="Type of the data file (json, xml, yaml).")
+    parser.add_argument("--stream", action="store_true", help="Validate XML while parsing instead of loading the whole document first. Uses less memory, but does not check that xs:ID values are unique.")
+    parser.add_argument("--fast", action="store_true", help="Validate JSON by decoding it into msgspec types generated from the schema, when the schema allows it.")
     return parser
 
 
-def load_data(file_path, file_type):
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments, bypassing argparse for the common invocation.
+
+    The exact shape `file_path schema_path --file_type TYPE` (or `--file_type=TYPE`) is
+    unpacked directly, since building the argparse parser costs more than the rest of
+    a small validation. Any other shape, including -h/--help, goes through argparse.
+
+    Args:
+        argv (list, optional): Arguments to parse; defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    file_type = None
+    if len(argv) == 4 and argv[2] == '--file_type':
+        file_type = argv[3]
+    elif len(argv) == 3 and argv[2].startswith('--file_type='):
+        file_type = argv[2][len('--file_type='):]
+    if file_type in _FILE_EXTENSIONS and not argv[0].startswith('-') and not argv[1].startswith('-'):
+        return argparse.Namespace(file_path=argv[0], schema_path=argv[1], file_type=file_type,
+                                  stream=False, fast=False)
+    return setup_argparse().parse_args(argv)
+
+
+def _import_lxml():
+    """
+    Imports lxml.etree, which is used to parse and validate XML.
+
+    Returns:
+        module or None: The lxml.etree module, or None if lxml is not installed.
+    """
+    try:
+        import lxml.etree as lxml_ET
+    except ImportError:
+        return None
+    return lxml_ET
+
+
+def _import_fastjsonschema():
+    """
+    Imports fastjsonschema, which generates specialized validator functions from a schema.
+
+    Returns:
+        module or None: The fastjsonschema module, or None if it is not installed.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    return fastjsonschema
+
+
+@contextlib.contextmanager
+def _read_input(file_path, file_stat=None):
+    """
+    Provides the raw contents of a file, without decoding it to text.
+
+    Files of at least _MMAP_THRESHOLD bytes are memory-mapped so parsers read straight
+    from the page cache; smaller files are read into a bytes object.
+
+    Args:
+        file_path (str): Path to the file.
+        file_stat (os.stat_result, optional): Result of a previous stat of the file.
+
+    Yields:
+        bytes or mmap.mmap: The file contents, valid until the context exits.
+    """
+    with open(file_path, 'rb') as f:
+        if file_stat is None:
+            file_stat = os.fstat(f.fileno())
+        if file_stat.st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def _parse_errors():
+    """
+    Returns the exception types the data and schema parsers raise for malformed input.
+
+    JSON decoders raise ValueError subclasses and XML parsers raise SyntaxError subclasses;
+    the YAML error type is included once PyYAML has been imported.
+
+    Returns:
+        tuple: Exception types to catch around parsing.
+    """
+    yaml = sys.modules.get('yaml')
+    if yaml is None:
+        return (ValueError, SyntaxError)
+    return (ValueError, SyntaxError, yaml.YAMLError)
+
+
+def _xml_parser(lxml_ET):
+    """
+    Returns the shared lxml parser used for XML data files.
+
+    Besides _XML_PARSE_OPTIONS, the parser skips building the ID table; XSD
+    validation tracks xs:ID values itself.
+
+    Args:
+        lxml_ET (module): The lxml.etree module.
+
+    Returns:
+        lxml.etree.XMLParser: The parser.
+    """
+    global _XML_PARSER
+    if _XML_PARSER is None:
+        _XML_PARSER = lxml_ET.XMLParser(collect_ids=False, **_XML_PARSE_OPTIONS)
+    return _XML_PARSER
+
+
+def _load_yaml(raw):
+    """
+    Parses YAML with a safe loader, using the libyaml-backed one when available.
+
+    Args:
+        raw (bytes or mmap.mmap): The YAML document.
+
+    Returns:
+        The parsed YAML document.
+    """
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)  # Safe loader prevents arbitrary code execution
+
+
+def _load_json(raw):
+    """
+    Parses JSON, preferring orjson and falling back to the standard library.
+
+    Documents containing integer literals of 19 or more digits are parsed with the
+    standard library, which keeps arbitrary-precision integers exact.
+
+    Args:
+        raw (bytes or mmap.mmap): The JSON document.
+
+    Returns:
+        The parsed JSON document.
+    """
+    if orjson is not None and _WIDE_INTEGER.search(raw) is None:
+        if isinstance(raw, mmap.mmap):
+            with memoryview(raw) as view:
+                return orjson.loads(view)
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def load_data(file_path: str, file_type: str, file_stat: Optional[os.stat_result] = None) -> Any:
     """
     Loads data from the specified file based on its type.
 
     Args:
         file_path (str): Path to the data file.
         file_type (str): Type of the data file (json, xml, yaml).
+        file_stat (os.stat_result, optional): Result of is_valid_file_path for the file.
 
     Returns:
-        dict or ET.Element: The loaded data as a dictionary (JSON, YAML) or an ElementTree (XML).
+        dict or lxml.etree._Element: The loaded data as a dictionary (JSON, YAML) or the root element (XML).
         None: If an error occurs during loading.
 
     Raises:
         FileNotFoundError: If the file does not exist.
-        ValueError: If the file type is unsupported.
-        Exception: For other errors during file reading or parsing.
+        ValueError: If the file type is unsupported or the JSON is malformed.
+        SyntaxError: If the XML is malformed.
+        yaml.YAMLError: If the YAML is malformed.
+        ImportError: If the file is XML and lxml is not installed.
     """
     try:
-        with open(file_path, 'r') as f:
+        if file_type == 'xml':
+            lxml_ET = _import_lxml()
+            if lxml_ET is None:
+                raise ImportError("XML support requires lxml.")
+            # Parse straight from the file into an lxml tree so XSD validation can use it as-is
+            return lxml_ET.parse(file_path, _xml_parser(lxml_ET)).getroot()
+        with _read_input(file_path, file_stat) as raw:
             if file_type == 'json':
-                data = json.load(f)
+                data = _load_json(raw)
             elif file_type == 'yaml':
-                data = yaml.safe_load(f)  # Use safe_load to prevent arbitrary code execution
-            elif file_type == 'xml':
-                tree = ET.parse(f)
-                data = tree.getroot()
+                data = _load_yaml(raw)
             else:
                 raise ValueError("Unsupported file type.")
-            return data
+        return data
     except FileNotFoundError:
         logging.error(f"File not found: {file_path}")
         raise
-    except ValueError as e:
+    except _parse_errors() as e:
         logging.error(f"Error loading data: {e}")
         raise
-    except Exception as e:
-        logging.exception(f"An unexpected error occurred: {e}")  # Log the full traceback
-        raise
 
 
-def load_schema(schema_path, file_type):
+def load_schema(schema_path: str, file_type: str, schema_stat: Optional[os.stat_result] = None) -> Any:
     """
     Loads the schema from the specified file.
 
     Args:
         schema_path (str): Path to the schema file.
         file_type (str): The file type to determine the loader method
+        schema_stat (os.stat_result, optional): Result of is_valid_file_path for the schema file.
 
     Returns:
         dict: The loaded schema as a dictionary (JSON, YAML).  For XML, returns the schema file path as string
@@ -80,37 +321,572 @@ def load_schema(schema_path, file_type):
 
     Raises:
         FileNotFoundError: If the schema file does not exist.
-        ValueError: If the schema file type is unsupported.
-        Exception: For other errors during schema file reading or parsing.
+        ValueError: If the schema file type is unsupported, the JSON is malformed, or the
+            schema is not valid against its meta-schema.
+        yaml.YAMLError: If the YAML is malformed.
     """
     try:
-        with open(schema_path, 'r') as f:
-            if file_type == 'json':
-                schema = json.load(f)
-            elif file_type == 'yaml':
-                schema = yaml.safe_load(f)
-            elif file_type == 'xml':
-                schema = schema_path  # returns the xsd path as a string
-            else:
-                raise ValueError("Unsupported schema file type.")
-            return schema
+        if file_type == 'json':
+            with _read_input(schema_path, schema_stat) as raw:
+                schema = _load_json(raw)
+            _check_schema(schema)
+        elif file_type == 'yaml':
+            with _read_input(schema_path, schema_stat) as raw:
+                schema = _load_yaml(raw)
+            _check_schema(schema)
+        elif file_type == 'xml':
+            if schema_stat is None:
+                os.stat(schema_path)  # the XSD is compiled at validation time; just make sure it exists
+            schema = schema_path  # returns the xsd path as a string
+        else:
+            raise ValueError("Unsupported schema file type.")
+        return schema
     except FileNotFoundError:
         logging.error(f"Schema file not found: {schema_path}")
         raise
-    except ValueError as e:
+    except _parse_errors() as e:
         logging.error(f"Error loading schema: {e}")
         raise
-    except Exception as e:
-        logging.exception(f"An unexpected error occurred: {e}")
-        raise
 
 
-def validate_data(data, schema, file_type):
+def _check_schema(schema):
+    """
+    Checks a JSON/YAML schema against its meta-schema, once per distinct schema.
+
+    Validators built later for a checked schema skip the meta-schema check.
+
+    Args:
+        schema (dict): The schema to check.
+
+    Raises:
+        ValueError: If the schema is not an object or boolean, or is not valid against
+            its meta-schema.
+    """
+    if not isinstance(schema, (dict, bool)):
+        # e.g. an empty YAML file, which loads as None
+        raise ValueError(f"Invalid schema: expected an object or boolean, got {type(schema).__name__}")
+    key = _schema_key(schema)
+    if key in _CHECKED_SCHEMAS:
+        return
+    import jsonschema
+    try:
+        jsonschema.validators.validator_for(schema).check_schema(schema)
+    except jsonschema.exceptions.SchemaError as e:
+        raise ValueError(f"Invalid schema: {e.message}") from e
+    _CHECKED_SCHEMAS.add(key)
+
+
+def _json_encoding(value):
+    """
+    Encodes a parsed schema or document as canonical JSON bytes for hashing.
+
+    No encoding is produced when JSON cannot represent the value exactly: non-string keys,
+    dates and other non-JSON types, integers beyond 64 bits, or NaN/Infinity, which orjson
+    would write as null.
+
+    Args:
+        value: The parsed schema or document.
+
+    Returns:
+        bytes or None: Sorted-key JSON, or None if the value has no exact JSON encoding.
+    """
+    if orjson is None:
+        return None
+    try:
+        encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return None
+    if b'null' in encoded and _contains_non_finite(value):
+        return None
+    return encoded
+
+
+def _contains_non_finite(value):
+    """
+    Checks whether a parsed schema or document contains a NaN or infinite float.
+
+    Args:
+        value: The parsed schema or document.
+
+    Returns:
+        bool: True if a non-finite float is present.
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
+def _tagged(value):
+    """
+    Converts a parsed schema into nested tuples tagged with type names, in a stable order.
+
+    Used to key schemas that have no exact JSON encoding, so that e.g. a date and a
+    string with the same text, or 1 and "1" as keys, still get different keys.
+
+    Args:
+        value: The parsed schema or fragment.
+
+    Returns:
+        tuple: The tagged representation.
+    """
+    if isinstance(value, dict):
+        items = ((_tagged(k), _tagged(v)) for k, v in value.items())
+        return ('dict', tuple(sorted(items, key=repr)))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_tagged(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value).__name__, tuple(sorted((_tagged(item) for item in value), key=repr)))
+    return (type(value).__name__, value)
+
+
+def _schema_key(schema):
+    """
+    Computes a stable hash of a JSON/YAML schema for use as a cache key.
+
+    Args:
+        schema (dict): The schema to hash.
+
+    Returns:
+        str: Hex digest that is identical for schemas with equal content.
+    """
+    encoded = _json_encoding(schema)
+    if encoded is None:
+        encoded = repr(_tagged(schema)).encode('utf-8')
+    return hashlib.blake2b(encoded).hexdigest()
+
+
+def _document_key(data):
+    """
+    Computes a hash of a parsed JSON/YAML document for memoizing validation results.
+
+    Only documents with an exact JSON encoding are hashed (see _json_encoding); values
+    such as dates, non-string keys or NaN could otherwise share a key with a differently
+    typed value.
+
+    Args:
+        data: The parsed document.
+
+    Returns:
+        str or None: Hex digest of the document, or None if it cannot be hashed safely.
+    """
+    encoded = _json_encoding(data)
+    if encoded is None:
+        return None
+    return hashlib.blake2b(encoded).hexdigest()
+
+
+def _is_draft7_compatible(node):
+    """
+    Checks whether a schema without $schema validates the same under draft-07 and 2020-12.
+
+    Args:
+        node: Schema or schema fragment to walk.
+
+    Returns:
+        bool: False if the schema uses a draft-sensitive keyword, an array-form "items",
+            or a $ref with sibling keywords (ignored before 2019-09).
+    """
+    if isinstance(node, dict):
+        if not _DRAFT_SENSITIVE_KEYWORDS.isdisjoint(node) or isinstance(node.get('items'), list):
+            return False
+        if '$ref' in node and not {'$ref', 'title', 'description'}.issuperset(node):
+            return False
+        return all(_is_draft7_compatible(value) for keyword, value in node.items()
+                   if keyword not in _NON_SCHEMA_KEYWORDS)
+    if isinstance(node, list):
+        return all(_is_draft7_compatible(value) for value in node)
+    return True
+
+
+def _has_fast_divergence(node):
+    """
+    Checks whether a schema uses anything fastjsonschema validates differently under any draft.
+
+    Args:
+        node: Schema or schema fragment to walk.
+
+    Returns:
+        bool: True if the schema uses a divergent keyword or a $ref outside the document,
+            which fastjsonschema would fetch while compiling.
+    """
+    if isinstance(node, dict):
+        if not _FAST_DIVERGENT_KEYWORDS.isdisjoint(node):
+            return True
+        if isinstance(node.get('$ref'), str) and not node['$ref'].startswith('#'):
+            return True
+        return any(_has_fast_divergence(value) for keyword, value in node.items()
+                   if keyword not in _NON_SCHEMA_KEYWORDS)
+    if isinstance(node, list):
+        return any(_has_fast_divergence(value) for value in node)
+    return False
+
+
+def _fast_validator_applies(schema):
+    """
+    Checks whether fastjsonschema gives the same verdicts as jsonschema for a schema.
+
+    Args:
+        schema (dict): The schema to validate against.
+
+    Returns:
+        bool: True if the schema declares draft-04/06/07, or declares no draft and uses
+            no keywords whose meaning depends on it, and uses no keyword fastjsonschema
+            handles differently.
+    """
+    if not isinstance(schema, dict):
+        return isinstance(schema, bool)
+    if _has_fast_divergence(schema):
+        return False
+    if '$schema' in schema:
+        return any(draft in str(schema['$schema']) for draft in _FAST_DRAFTS)
+    return _is_draft7_compatible(schema)
+
+
+def _get_fast_validator(schema, key):
+    """
+    Returns a fastjsonschema-generated validator function for the schema, if one can be built.
+
+    Schemas that fastjsonschema cannot compile, or whose verdicts could differ from
+    jsonschema's (see _fast_validator_applies), are cached as None so they go through
+    jsonschema instead.
+
+    Args:
+        schema (dict): The schema to validate against.
+        key (str): Cache key for the schema, as returned by _schema_key.
+
+    Returns:
+        callable or None: The compiled validator, or None if jsonschema must be used.
+    """
+    if key in _FJS_CACHE:
+        return _FJS_CACHE[key]
+    fastjsonschema = _import_fastjsonschema()
+    if fastjsonschema is None:
+        return None
+    validator = None
+    if _fast_validator_applies(schema):
+        try:
+            validator = _load_generated_validator(fastjsonschema, schema, key)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            logging.debug(f"Falling back to jsonschema: {e}")
+    _FJS_CACHE[key] = validator
+    return validator
+
+
+def _load_generated_validator(fastjsonschema: Any, schema: Any, key: str) -> Callable[[Any], Any]:
+    """
+    Loads the fastjsonschema validator module generated for a schema, generating it if needed.
+
+    The generated source is written to _CODE_CACHE_DIR, so later runs import it instead of
+    compiling the schema again. If the cache directory cannot be used, the source is
+    generated and executed in memory.
+
+    Args:
+        fastjsonschema (module): The fastjsonschema module.
+        schema (dict): The schema to validate against.
+        key (str): Cache key for the schema, as returned by _schema_key.
+
+    Returns:
+        callable: The generated validate function.
+
+    Raises:
+        fastjsonschema.JsonSchemaDefinitionException: If fastjsonschema cannot compile the schema.
+    """
+    module_name = f"fjs_{key}_{fastjsonschema.VERSION.replace('.', '_')}_noformats_v2"
+    module_path = os.path.join(_CODE_CACHE_DIR, module_name + '.py')
+    if not os.path.exists(module_path):
+        # jsonschema treats "format" as an annotation and never fills in defaults; match it
+        code = fastjsonschema.compile_to_code(schema, use_default=False, use_formats=False)
+        # The root function is named after the schema's $id, if it has one; export it under a fixed name
+        root_function = _FJS_FUNCTION_DEF.search(code)
+        if root_function is None:
+            raise fastjsonschema.JsonSchemaDefinitionException("Generated validator defines no function.")
+        code += f"\nvalidate = {root_function.group(1)}\n"
+        try:
+            os.makedirs(_CODE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{module_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(code)
+            os.replace(tmp_path, module_path)
+        except OSError as e:
+            logging.debug(f"Not caching generated validator: {e}")
+            namespace: dict[str, Any] = {}
+            exec(code, namespace)
+            return namespace['validate']
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load generated validator: {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def _get_validator(schema, key=None):
+    """
+    Returns a jsonschema validator for the schema, building and caching it on first use.
+
+    The schema is checked against its meta-schema only when the validator is built,
+    and not at all if load_schema already checked it, so repeated validations against
+    the same schema skip that work.
+
+    Args:
+        schema (dict): The schema to validate against.
+        key (str, optional): Precomputed cache key for the schema.
+
+    Returns:
+        jsonschema.protocols.Validator: The cached validator instance.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+    """
+    if key is None:
+        key = _schema_key(schema)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        import jsonschema
+        cls = jsonschema.validators.validator_for(schema)
+        if key not in _CHECKED_SCHEMAS:
+            cls.check_schema(schema)
+            _CHECKED_SCHEMAS.add(key)
+        store = _collect_schema_ids(schema)
+        if store:
+            validator = _with_local_refs(jsonschema, cls, schema, store)
+        else:
+            validator = cls(schema)
+        _VALIDATORS[key] = validator
+    return validator
+
+
+def _collect_schema_ids(node, base='', store=None):
+    """
+    Collects the subschemas of a schema that declare an $id, keyed by their absolute URI.
+
+    Args:
+        node: Schema or schema fragment to walk.
+        base (str): Base URI in effect for the fragment.
+        store (dict, optional): Store to add the subschemas to.
+
+    Returns:
+        dict: Subschemas by absolute $id URI.
+    """
+    if store is None:
+        store = {}
+    if isinstance(node, dict):
+        node_id = node.get('$id')
+        if isinstance(node_id, str) and not node_id.startswith('#'):
+            base = urljoin(base, node_id)
+            store[base.rstrip('#')] = node
+        for keyword, value in node.items():
+            if keyword not in _NON_SCHEMA_KEYWORDS:
+                _collect_schema_ids(value, base, store)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_schema_ids(value, base, store)
+    return store
+
+
+def _with_local_refs(jsonschema, cls, schema, store):
+    """
+    Builds a validator whose $ref lookups for the given $id URIs are served from memory.
+
+    Args:
+        jsonschema (module): The jsonschema module.
+        cls (type): The validator class for the schema's dialect.
+        schema (dict): The schema to validate against.
+        store (dict): Subschemas by absolute $id URI, from _collect_schema_ids.
+
+    Returns:
+        jsonschema.protocols.Validator: The validator instance.
+    """
+    try:
+        import referencing
+        import referencing.jsonschema
+    except ImportError:
+        # jsonschema < 4.18 resolves references through RefResolver
+        return cls(schema, resolver=jsonschema.RefResolver.from_schema(schema, store=store))
+    specification = referencing.jsonschema.specification_with(
+        schema.get('$schema', ''), default=referencing.jsonschema.DRAFT202012)
+    registry = referencing.Registry().with_resources(
+        (uri, referencing.Resource.from_contents(subschema, default_specification=specification))
+        for uri, subschema in store.items())
+    return cls(schema, registry=registry)
+
+
+def _get_xml_schema(lxml_ET, schema_path):
+    """
+    Returns the compiled XMLSchema for an XSD file, reusing it until the file changes.
+
+    Args:
+        lxml_ET (module): The lxml.etree module.
+        schema_path (str): Path to the XSD file.
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema.
+
+    Raises:
+        lxml.etree.XMLSchemaParseError: If the XSD is not a valid schema.
+        lxml.etree.XMLSyntaxError: If the XSD is not well-formed XML.
+    """
+    key = (schema_path, os.stat(schema_path).st_mtime)
+    xmlschema = _XSD_CACHE.get(key)
+    if xmlschema is None:
+        xmlschema = lxml_ET.XMLSchema(lxml_ET.parse(schema_path))
+        _XSD_CACHE[key] = xmlschema
+    return xmlschema
+
+
+def _compiled_validator(schema, key=None):
+    """
+    Returns a callable that validates a document against the schema.
+
+    Args:
+        schema (dict): The schema to validate against.
+        key (str, optional): Precomputed cache key for the schema.
+
+    Returns:
+        callable: Validator taking the document; raises on invalid documents.
+    """
+    if key is None:
+        key = _schema_key(schema)
+    fast_validator = _get_fast_validator(schema, key)
+    if fast_validator is not None:
+        return fast_validator
+    return _get_validator(schema, key).validate
+
+
+def _contains_ref(node):
+    """
+    Checks whether a schema fragment contains a $ref anywhere inside it.
+
+    Args:
+        node: Schema fragment.
+
+    Returns:
+        bool: True if a $ref keyword is present.
+    """
+    if isinstance(node, dict):
+        return '$ref' in node or any(_contains_ref(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_contains_ref(value) for value in node)
+    return False
+
+
+def _get_array_plan(schema, key):
+    """
+    Splits an array-of-records schema into an array-level validator and an item validator.
+
+    Only schemas made of plain array keywords with a single object under "items" qualify;
+    an item schema containing $ref is left alone because it may point back into the root.
+
+    Args:
+        schema (dict): The schema to validate against.
+        key (str): Cache key for the schema, as returned by _schema_key.
+
+    Returns:
+        tuple or None: (array validator, item validator), or None if the schema does not qualify.
+    """
+    if key in _ARRAY_PLANS:
+        return _ARRAY_PLANS[key]
+    plan = None
+    if isinstance(schema, dict) and schema.get('type') == 'array':
+        items = schema.get('items')
+        if isinstance(items, dict) and _ARRAY_SCHEMA_KEYWORDS.issuperset(schema) and not _contains_ref(items):
+            array_schema = {k: v for k, v in schema.items() if k != 'items'}
+            if '$schema' in schema:
+                items = dict(items, **{'$schema': schema['$schema']})
+            plan = (_compiled_validator(array_schema), _compiled_validator(items))
+    _ARRAY_PLANS[key] = plan
+    return plan
+
+
+def _validate_document(data, schema, validation_errors):
+    """
+    Validates a JSON/YAML document, using a generated fastjsonschema validator when possible.
+
+    Arrays validated against an array-of-records schema are checked item by item with a
+    validator compiled once for the item schema, after the array-level keywords. Documents
+    that already passed against the same schema are not validated again.
+
+    Args:
+        data: The parsed document.
+        schema (dict): The schema to validate against.
+        validation_errors (tuple): Exception types raised for an invalid document.
+
+    Raises:
+        fastjsonschema.JsonSchemaException: If the document is invalid (fastjsonschema path).
+        jsonschema.exceptions.ValidationError: If the document is invalid (jsonschema path).
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+    """
+    key = _schema_key(schema)
+    document_key = _document_key(data)
+    if document_key is not None:
+        cache_key = (key, document_key)
+        if cache_key in _VALIDATION_CACHE:
+            _VALIDATION_CACHE.move_to_end(cache_key)
+            return
+
+    plan = _get_array_plan(schema, key) if isinstance(data, list) else None
+    if plan is not None:
+        validate_array, validate_item = plan
+        validate_array(data)
+        try:
+            for item in data:
+                validate_item(item)
+        except validation_errors:
+            # Item errors lack the record's position; rerun on the whole document so the
+            # reported error names the failing record (e.g. data[1].age)
+            _compiled_validator(schema, key)(data)
+            raise
+    else:
+        _compiled_validator(schema, key)(data)
+
+    if document_key is not None:
+        _VALIDATION_CACHE[cache_key] = True
+        if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+
+
+def _validate_xml(data, schema_path):
+    """
+    Validates a parsed XML document against an XSD file.
+
+    Args:
+        data (lxml.etree._Element): Root element of the document.
+        schema_path (str): Path to the XSD file.
+
+    Returns:
+        bool: True if the data is valid, False otherwise.
+    """
+    lxml_ET = _import_lxml()
+    if lxml_ET is None:
+        logging.error("XML schema validation requires lxml.")
+        return False
+    try:
+        xmlschema = _get_xml_schema(lxml_ET, schema_path)
+        xmlschema.assertValid(data)
+        return True
+
+    except lxml_ET.DocumentInvalid as e:
+        logging.error(f"XML validation error: {e}")
+        return False
+    except lxml_ET.XMLSchemaError as e:
+        logging.error(f"XML Schema validation error: {e}")
+        return False
+    except lxml_ET.XMLSyntaxError as e:
+        logging.error(f"XML Syntax Error: {e}")
+        return False
+
+
+def validate_data(data: Any, schema: Any, file_type: str) -> bool:
     """
     Validates the data against the provided schema.
 
     Args:
-        data (dict or ET.Element): The data to validate.
+        data (dict or lxml.etree._Element): The data to validate.
         schema (dict or str): The schema to validate against. If XML file type, schema will be a string representing the xsd file path
         file_type (str): Type of the data file (json, xml, yaml).
 
@@ -119,56 +895,347 @@ def validate_data(data, schema, file_type):
 
     Raises:
         jsonschema.exceptions.ValidationError: If the data does not conform to the schema (for JSON and YAML).
-        ET.ParseError: If the XML validation fails.
+        fastjsonschema.JsonSchemaException: If the data does not conform to a schema compiled by fastjsonschema.
+        lxml.etree.DocumentInvalid: If the XML document does not conform to the XSD.
         ValueError: If the file_type is not supported.
-        Exception: For unexpected validation errors.
     """
+    if file_type == 'xml':
+        return _validate_xml(data, schema)
+
+    import jsonschema
+    fastjsonschema = _import_fastjsonschema()
+    fast_validation_errors = (fastjsonschema.JsonSchemaException,) if fastjsonschema is not None else ()
+    validation_errors = (jsonschema.exceptions.ValidationError,) + fast_validation_errors
     try:
         if file_type == 'json':
-            validate(instance=data, schema=schema)
+            _validate_document(data, schema, validation_errors)
             return True
         elif file_type == 'yaml':
-            validate(instance=data, schema=schema)
+            _validate_document(data, schema, validation_errors)
             return True
-        elif file_type == 'xml':
-            try:
-                # XML validation against XSD is a complex topic that requires additional libraries and careful implementation
-                # This part of the script can be extended to perform more robust XML validation with XSD.
-                import lxml.etree as lxml_ET
-                xmlschema_doc = lxml_ET.parse(schema)
-                xmlschema = lxml_ET.XMLSchema(xmlschema_doc)
-                xml_string = ET.tostring(data)
-                xml_doc = lxml_ET.fromstring(xml_string)
-
-                xmlschema.assertValid(xml_doc)
-                return True
-
-            except lxml.etree.XMLSchemaError as e:
-                logging.error(f"XML Schema validation error: {e}")
-                return False
-            except lxml.etree.XMLSyntaxError as e:
-                logging.error(f"XML Syntax Error: {e}")
-                return False
-            except Exception as e:
-                logging.exception(f"An unexpected error occurred: {e}")
-                return False
         else:
             raise ValueError("Unsupported file type.")
     except jsonschema.exceptions.ValidationError as e:
         logging.error(f"Validation error: {e}")
         return False
+    except fast_validation_errors as e:
+        logging.error(f"Validation error: {e}")
+        return False
     except jsonschema.exceptions.SchemaError as e:
         logging.error(f"Schema error: {e}")
         return False
     except ValueError as e:
         logging.error(f"Error during validation: {e}")
         return False
+
+
+def _schema_to_msgspec_type(msgspec, schema, name):
+    """
+    Translates a JSON Schema into the equivalent type for msgspec to decode into.
+
+    Only plain structural schemas are supported: primitive types (or lists of them),
+    arrays with an optional "items" schema, and objects described by "properties",
+    "required" and a boolean "additionalProperties".
+
+    Args:
+        msgspec (module): The msgspec module.
+        schema (dict): The schema to translate.
+        name (str): Name for a generated Struct type.
+
+    Returns:
+        type or None: The msgspec type, or None if the schema uses unsupported keywords.
+    """
+    if not isinstance(schema, dict):
+        return None
+    schema_type = schema.get('type')
+    if schema_type is None:
+        return Any if _MSGSPEC_ANNOTATIONS.issuperset(schema) else None
+    if isinstance(schema_type, list):
+        if not _MSGSPEC_ANNOTATIONS.union({'type'}).issuperset(schema) \
+                or not schema_type or not all(t in _MSGSPEC_PRIMITIVES for t in schema_type):
+            return None
+        return Union[tuple(_MSGSPEC_PRIMITIVES[t] for t in schema_type)]
+    if schema_type in _MSGSPEC_PRIMITIVES:
+        return _MSGSPEC_PRIMITIVES[schema_type] if _MSGSPEC_ANNOTATIONS.union({'type'}).issuperset(schema) else None
+    if schema_type == 'array':
+        if not _MSGSPEC_ANNOTATIONS.union({'type', 'items'}).issuperset(schema):
+            return None
+        if 'items' not in schema:
+            return list
+        item_type = _schema_to_msgspec_type(msgspec, schema['items'], name + '_item')
+        return None if item_type is None else list[item_type]
+    if schema_type == 'object':
+        if not _MSGSPEC_ANNOTATIONS.union({'type', 'properties', 'required', 'additionalProperties'}).issuperset(schema):
+            return None
+        properties = schema.get('properties', {})
+        required = schema.get('required', [])
+        additional = schema.get('additionalProperties', True)
+        if not isinstance(properties, dict) or not isinstance(additional, bool) \
+                or not set(required).issubset(properties):
+            return None
+        if not properties and additional:
+            return dict
+        fields = []
+        rename = {}
+        for index, (prop, prop_schema) in enumerate(properties.items()):
+            prop_type = _schema_to_msgspec_type(msgspec, prop_schema, f"{name}_{index}")
+            if prop_type is None:
+                return None
+            # Generated field names keep arbitrary property names from clashing with Python syntax
+            field = f"f_{index}"
+            rename[field] = prop
+            if prop in required:
+                fields.append((field, prop_type))
+            else:
+                fields.append((field, Union[prop_type, msgspec.UnsetType], msgspec.UNSET))
+        return msgspec.defstruct(name, fields, rename=rename, kw_only=True, forbid_unknown_fields=not additional)
+    return None
+
+
+def _get_msgspec_decoder(schema):
+    """
+    Returns a msgspec JSON decoder that validates documents against the schema while decoding.
+
+    Args:
+        schema (dict): The schema to validate against.
+
+    Returns:
+        msgspec.json.Decoder or None: The decoder, or None if msgspec is not installed or
+            the schema cannot be expressed as msgspec types.
+    """
+    key = _schema_key(schema)
+    if key in _MSGSPEC_DECODERS:
+        return _MSGSPEC_DECODERS[key]
+    decoder = None
+    try:
+        import msgspec
+    except ImportError:
+        msgspec = None
+    if msgspec is not None:
+        decode_type = _schema_to_msgspec_type(msgspec, schema, 'Document')
+        if decode_type is not None:
+            try:
+                decoder = msgspec.json.Decoder(decode_type)
+            except TypeError as e:
+                logging.debug(f"Schema not supported by msgspec: {e}")
+    _MSGSPEC_DECODERS[key] = decoder
+    return decoder
+
+
+def validate_json_fast(file_path, schema, file_stat=None):
+    """
+    Validates a JSON file by decoding it straight into msgspec types generated from the schema.
+
+    Parsing and validation happen in a single pass in C, without building an intermediate
+    dict for jsonschema to walk. msgspec is stricter than JSON Schema in places (it rejects
+    1.0 for an integer field, for example), so documents it rejects are left to the
+    regular validator to decide.
+
+    Args:
+        file_path (str): Path to the JSON data file.
+        schema (dict): The schema to validate against.
+        file_stat (os.stat_result, optional): Result of is_valid_file_path for the file.
+
+    Returns:
+        bool: True if the data is valid, False if it is not well-formed JSON.
+        None: If the schema cannot be validated this way or msgspec rejects the document,
+            and the regular path must be used.
+    """
+    decoder = _get_msgspec_decoder(schema)
+    if decoder is None:
+        return None
+    import msgspec
+    try:
+        with _read_input(file_path, file_stat) as raw:
+            if isinstance(raw, mmap.mmap):
+                with memoryview(raw) as view:
+                    decoder.decode(view)
+            else:
+                decoder.decode(raw)
+        return True
+    except msgspec.ValidationError as e:
+        logging.debug(f"msgspec rejected {file_path}, using the regular validator: {e}")
+        return None
+    except msgspec.DecodeError as e:
+        logging.error(f"Error loading data: {e}")
+        return False
+
+
+def _has_doctype(file_path):
+    """
+    Checks whether an XML file declares a DOCTYPE before its root element.
+
+    Args:
+        file_path (str): Path to the XML data file.
+
+    Returns:
+        bool: True if the prolog contains a DOCTYPE, or the file is in an encoding other
+            than UTF-8 and so cannot be checked.
+    """
+    with open(file_path, 'rb') as f:
+        head = b''
+        while True:
+            chunk = f.read(1 << 16)
+            head += chunk
+            if head.startswith((b'\xfe\xff', b'\xff\xfe', b'\x00', b'<\x00')):
+                return True
+            start = 3 if head.startswith(b'\xef\xbb\xbf') else 0
+            rest = head[_XML_PROLOG_MISC.match(head, start).end():]
+            # Read on while the prolog may continue past what has been read so far
+            if not chunk or (len(rest) >= len(b'<!DOCTYPE') and not rest.startswith((b'<?', b'<!--'))):
+                return rest.startswith(b'<!DOCTYPE')
+
+
+def validate_xml_stream(file_path, schema_path):
+    """
+    Validates an XML file against an XSD while it is being parsed.
+
+    Completed elements are cleared as soon as they have been validated, so memory use
+    stays bounded by the document depth rather than its size. libxml2's streaming
+    validator does not check xs:ID uniqueness, so duplicate IDs are not reported here.
+    Documents with a DOCTYPE are validated as a whole tree instead, since libxml2
+    crashes when it validates entity references while streaming.
+
+    Args:
+        file_path (str): Path to the XML data file.
+        schema_path (str): Path to the XSD file.
+
+    Returns:
+        bool: True if the data is valid, False otherwise.
+    """
+    lxml_ET = _import_lxml()
+    if lxml_ET is None:
+        logging.error("XML schema validation requires lxml.")
+        return False
+    if _has_doctype(file_path):
+        try:
+            data = load_data(file_path, 'xml')
+        except SyntaxError:
+            # Already logged by load_data
+            return False
+        return _validate_xml(data, schema_path)
+    try:
+        xmlschema = _get_xml_schema(lxml_ET, schema_path)
+        for _, elem in lxml_ET.iterparse(file_path, events=('end',), schema=xmlschema, **_XML_PARSE_OPTIONS):
+            elem.clear()
+            # Drop references to already processed siblings as well
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return True
+    except lxml_ET.XMLSchemaError as e:
+        logging.error(f"XML Schema validation error: {e}")
+        return False
+    except lxml_ET.XMLSyntaxError as e:
+        # libxml2 reports validity errors found during parsing as syntax errors
+        logging.error(f"XML validation error: {e}")
+        return False
+
+
+def find_data_files(file_path, file_type):
+    """
+    Expands a directory or glob pattern into the data files it refers to.
+
+    Args:
+        file_path (str): Directory, glob pattern, or path to a single data file.
+        file_type (str): Type of the data files (json, xml, yaml).
+
+    Returns:
+        list: Sorted paths of the matching files.
+        None: If file_path refers to a single file rather than a batch.
+    """
+    if os.path.isfile(file_path):
+        # An existing file is never a pattern, even if its name contains glob characters
+        return None
+    if os.path.isdir(file_path):
+        extensions = _FILE_EXTENSIONS[file_type]
+        with os.scandir(file_path) as entries:
+            return sorted(entry.path for entry in entries if entry.is_file() and entry.name.endswith(extensions))
+    if glob.has_magic(file_path):
+        return sorted(path for path in glob.glob(file_path, recursive=True) if os.path.isfile(path))
+    return None
+
+
+def _init_batch_worker(schema, file_type, stream, fast):
+    """
+    Initializes a batch validation worker process with the schema and options to use.
+
+    The schema is compiled here, once per worker, instead of once per validated file.
+
+    Args:
+        schema (dict or str): The loaded schema (XSD path for XML).
+        file_type (str): Type of the data files (json, xml, yaml).
+        stream (bool): Whether XML files are validated while streaming.
+        fast (bool): Whether JSON files are validated with msgspec when the schema allows it.
+    """
+    _BATCH_CONFIG.update(schema=schema, file_type=file_type, stream=stream, fast=fast)
+    try:
+        if file_type == 'xml':
+            lxml_ET = _import_lxml()
+            if lxml_ET is not None:
+                _get_xml_schema(lxml_ET, schema)
+        elif not (fast and file_type == 'json' and _get_msgspec_decoder(schema) is not None):
+            _compiled_validator(schema)
+    except Exception as e:
+        # Reported again, per file, when validation is attempted
+        logging.debug(f"Could not precompile schema: {e}")
+
+
+def _validate_batch_file(file_path):
+    """
+    Validates one file of a batch against the worker's schema.
+
+    Args:
+        file_path (str): Path to the data file.
+
+    Returns:
+        bool: True if the data is valid, False otherwise.
+    """
+    schema = _BATCH_CONFIG['schema']
+    file_type = _BATCH_CONFIG['file_type']
+    try:
+        if _BATCH_CONFIG['stream'] and file_type == 'xml':
+            return validate_xml_stream(file_path, schema)
+        if _BATCH_CONFIG['fast'] and file_type == 'json':
+            valid = validate_json_fast(file_path, schema)
+            if valid is not None:
+                return valid
+        try:
+            data = load_data(file_path, file_type)
+        except (FileNotFoundError,) + _parse_errors():
+            # Already logged by load_data
+            return False
+        return validate_data(data, schema, file_type)
     except Exception as e:
-        logging.exception(f"An unexpected error occurred: {e}")
+        # Tracebacks are only formatted when they will actually be shown
+        logging.error(f"Failed to validate {file_path}: {e}", exc_info=logging.root.isEnabledFor(logging.DEBUG))
         return False
 
 
-def is_valid_file_path(file_path):
+def validate_batch(file_paths, schema, file_type, stream=False, fast=False, max_workers=None):
+    """
+    Validates many data files against one schema in parallel worker processes.
+
+    Args:
+        file_paths (list): Paths of the data files.
+        schema (dict or str): The loaded schema (XSD path for XML).
+        file_type (str): Type of the data files (json, xml, yaml).
+        stream (bool): Whether XML files are validated while streaming.
+        fast (bool): Whether JSON files are validated with msgspec when the schema allows it.
+        max_workers (int, optional): Number of worker processes; defaults to the CPU count.
+
+    Returns:
+        list: (file path, bool) pairs in the order of file_paths.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths)) or 1
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                             initargs=(schema, file_type, stream, fast)) as executor:
+        results = executor.map(_validate_batch_file, file_paths, chunksize=16)
+        return list(zip(file_paths, results))
+
+
+def is_valid_file_path(file_path: str) -> Optional[os.stat_result]:
     """
     Check if a file path is valid.
 
@@ -176,41 +1243,98 @@ def is_valid_file_path(file_path):
         file_path (str): The path to the file.
 
     Returns:
-        bool: True if the file path is valid, False otherwise.
+        os.stat_result: The file's stat result if the file path is valid, so callers can reuse it.
+        None: If the file path is not valid.
     """
     try:
-        # Check if the file exists and is a file
-        if not Path(file_path).is_file():
-            logging.warning(f"File does not exist or is not a file: {file_path}")
-            return False
-        # Check if the file is readable
-        if not os.access(file_path, os.R_OK):
-            logging.warning(f"File is not readable: {file_path}")
-            return False
-        return True
-    except Exception as e:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        logging.warning(f"File does not exist or is not a file: {file_path}")
+        return None
+    except OSError as e:
         logging.error(f"Error checking file path: {e}")
-        return False
+        return None
+    # Check that the path is a regular file
+    if not stat.S_ISREG(file_stat.st_mode):
+        logging.warning(f"File does not exist or is not a file: {file_path}")
+        return None
+    # Check if the file is readable
+    if not os.access(file_path, os.R_OK):
+        logging.warning(f"File is not readable: {file_path}")
+        return None
+    return file_stat
+
+
+def run_batch(file_paths, args):
+    """
+    Validates a batch of data files and prints the outcome.
+
+    Args:
+        file_paths (list): Paths of the data files.
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    if not file_paths:
+        print("No data files found. Exiting.")
+        return
+    schema_stat = is_valid_file_path(args.schema_path)
+    if schema_stat is None:
+        print("Invalid schema path. Exiting.")
+        return
+
+    try:
+        schema = load_schema(args.schema_path, args.file_type, schema_stat)
+        results = validate_batch(file_paths, schema, args.file_type, args.stream, args.fast)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return
+
+    failed = [path for path, valid in results if not valid]
+    for path in failed:
+        print(f"Data validation failed: {path}")
+    print(f"Validated {len(results)} files, {len(failed)} failed.")
 
 
 def main():
     """
     Main function to parse arguments, load data and schema, and validate the data.
     """
-    parser = setup_argparse()
-    args = parser.parse_args()
+    args = parse_args()
+
+    batch_paths = find_data_files(args.file_path, args.file_type)
+    if batch_paths is not None:
+        run_batch(batch_paths, args)
+        return
 
     # Input validation: Check if the file paths are valid
-    if not is_valid_file_path(args.file_path):
+    file_stat = is_valid_file_path(args.file_path)
+    if file_stat is None:
         print("Invalid file path. Exiting.")
         return
-    if not is_valid_file_path(args.schema_path):
+    schema_stat = is_valid_file_path(args.schema_path)
+    if schema_stat is None:
         print("Invalid schema path. Exiting.")
         return
 
     try:
-        data = load_data(args.file_path, args.file_type)
-        schema = load_schema(args.schema_path, args.file_type)
+        if args.stream and args.file_type == 'xml':
+            if validate_xml_stream(args.file_path, args.schema_path):
+                print("Data validation successful.")
+            else:
+                print("Data validation failed.")
+            return
+
+        schema = None
+        if args.fast and args.file_type == 'json':
+            schema = load_schema(args.schema_path, args.file_type, schema_stat)
+            valid = validate_json_fast(args.file_path, schema, file_stat)
+            if valid is not None:
+                print("Data validation successful." if valid else "Data validation failed.")
+                return
+
+        data = load_data(args.file_path, args.file_type, file_stat)
+        if schema is None:
+            # Not loaded yet unless --fast fell back to the regular path
+            schema = load_schema(args.schema_path, args.file_type, schema_stat)
 
         if data is not None and schema is not None:
             if validate_data(data, schema, args.file_type):